@@ -6,14 +6,18 @@ Reads link _ids (one per line) from the input file, fetches each link to get
 the current _rev, and deletes it.
 """
 
+import base64
 import json
 import secrets
 import sys
 import time
 
-import jwt
+import orjson
 import requests
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 from jwcrypto import jwk
+from requests.adapters import HTTPAdapter, Retry
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CONSTANTS — update these before running
@@ -33,16 +37,50 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# Back off exponentially on throttling (429) and transient gateway errors,
+# honoring Retry-After; the final response still goes through raise_for_status()
+RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=("GET", "DELETE"),
+    raise_on_status=False,
+)
+
+# Only request the link attributes the script reads, to keep responses small
+LINK_FIELDS = "_id,_rev,firstId,secondId"
+
+# Shared session so every call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=RETRY))
+
+
+def _b64url(data):
+    """Base64url-encode bytes without padding, as used in JWTs."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 class TokenManager:
-    """Token manager that refreshes on 401 errors."""
+    """Token manager that refreshes shortly before expiry, or on 401 errors."""
 
     def __init__(self):
         self._token = None
+        self._expires_at = 0
         with open(SERVICE_ACCOUNT_JWK_FILE) as f:
             jwk_data = json.load(f)
         key = jwk.JWK(**jwk_data)
-        self._private_key_pem = key.export_to_pem(private_key=True, password=None)
+        pem = key.export_to_pem(private_key=True, password=None)
+        self._private_key = serialization.load_pem_private_key(pem, password=None)
+
+    def _sign_jwt(self, payload):
+        """Return a compact RS256 JWS for the payload, signed with the service account key."""
+        header = {"alg": "RS256", "typ": "JWT"}
+        signing_input = b".".join(
+            _b64url(json.dumps(part, separators=(",", ":")).encode()) for part in (header, payload)
+        )
+        signature = self._private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        return (signing_input + b"." + _b64url(signature)).decode()
 
     def refresh(self):
         """Fetch a new access token via JWT bearer assertion."""
@@ -54,7 +92,7 @@ class TokenManager:
             "exp": now + 899,
             "jti": secrets.token_urlsafe(16),
         }
-        signed_jwt = jwt.encode(payload, self._private_key_pem, algorithm="RS256")
+        signed_jwt = self._sign_jwt(payload)
 
         resp = requests.post(
             TOKEN_ENDPOINT,
@@ -69,13 +107,15 @@ class TokenManager:
         resp.raise_for_status()
         data = resp.json()
         self._token = data["access_token"]
+        # Renew 30s early so requests never go out with an expiring token
+        self._expires_at = time.time() + int(data.get("expires_in", 899)) - 30
+        SESSION.headers["Authorization"] = f"Bearer {self._token}"
         print(f"  Token acquired (expires in {data.get('expires_in', '?')}s)")
 
-    @property
-    def token(self):
-        if not self._token:
+    def ensure_token(self):
+        """Acquire a token if none is held or it is about to expire."""
+        if not self._token or time.time() >= self._expires_at:
             self.refresh()
-        return self._token
 
 
 # Global token manager
@@ -83,29 +123,29 @@ token_mgr = None
 
 
 def _do_request(method, path, params=None, rev=None):
-    """Execute an API request, retry once on 401 with a refreshed token."""
+    """Execute an API request, retry once on 401 with a refreshed token as a safety net."""
     url = f"{BASE_URL}{path}"
+    # Static headers and the bearer token already live on SESSION
+    headers = {"If-Match": rev} if rev else None
     for attempt in range(2):
-        headers = {**HEADERS, "Authorization": f"Bearer {token_mgr.token}"}
-        if rev:
-            headers["If-Match"] = rev
-        resp = method(url, headers=headers, params=params)
+        token_mgr.ensure_token()
+        resp = SESSION.request(method, url, headers=headers, params=params)
         if resp.status_code == 401 and attempt == 0:
             print("  Token expired, refreshing...")
             token_mgr.refresh()
             continue
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
 
 def api_get(path, params=None):
     """GET request to PAIC IDM API."""
-    return _do_request(requests.get, path, params=params)
+    return _do_request("GET", path, params=params)
 
 
 def api_delete(path, rev):
     """DELETE request to PAIC IDM API with If-Match rev."""
-    return _do_request(requests.delete, path, rev=rev)
+    return _do_request("DELETE", path, rev=rev)
 
 
 def main():
@@ -146,7 +186,7 @@ def main():
 
         # Fetch the link to get current _rev
         try:
-            link = api_get(f"/repo/link/{link_id}")
+            link = api_get(f"/repo/link/{link_id}", params={"_fields": LINK_FIELDS})
         except requests.exceptions.HTTPError as e:
             if e.response is not None and e.response.status_code == 404:
                 print(f"  WARNING: Link {link_id} not found (already deleted?)")
@@ -9,14 +9,18 @@ Two modes:
                write all link _ids to a file.
 """
 
+import base64
 import json
 import secrets
 import sys
 import time
 
-import jwt
+import orjson
 import requests
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 from jwcrypto import jwk
+from requests.adapters import HTTPAdapter, Retry
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CONSTANTS — update these before running
@@ -37,16 +41,55 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# Back off exponentially on throttling (429) and transient gateway errors,
+# honoring Retry-After; the final response still goes through raise_for_status()
+RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=("GET", "DELETE"),
+    raise_on_status=False,
+)
+
+# Results requested per page; FALLBACK_PAGE_SIZE is used if the server rejects PAGE_SIZE
+PAGE_SIZE = 1000
+FALLBACK_PAGE_SIZE = 500
+
+# Only request the attributes the scripts read, to keep response payloads small
+ENTRY_FIELDS = "_id,sourceObjectId,targetObjectId"
+LINK_FIELDS = "_id,_rev,firstId,secondId"
+
+# Shared session so every call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=RETRY))
+
+
+def _b64url(data):
+    """Base64url-encode bytes without padding, as used in JWTs."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 class TokenManager:
-    """Token manager that refreshes on 401 errors."""
+    """Token manager that refreshes shortly before expiry, or on 401 errors."""
 
     def __init__(self):
         self._token = None
+        self._expires_at = 0
         with open(SERVICE_ACCOUNT_JWK_FILE) as f:
             jwk_data = json.load(f)
         key = jwk.JWK(**jwk_data)
-        self._private_key_pem = key.export_to_pem(private_key=True, password=None)
+        pem = key.export_to_pem(private_key=True, password=None)
+        self._private_key = serialization.load_pem_private_key(pem, password=None)
+
+    def _sign_jwt(self, payload):
+        """Return a compact RS256 JWS for the payload, signed with the service account key."""
+        header = {"alg": "RS256", "typ": "JWT"}
+        signing_input = b".".join(
+            _b64url(json.dumps(part, separators=(",", ":")).encode()) for part in (header, payload)
+        )
+        signature = self._private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        return (signing_input + b"." + _b64url(signature)).decode()
 
     def refresh(self):
         """Fetch a new access token via JWT bearer assertion."""
@@ -58,7 +101,7 @@ class TokenManager:
             "exp": now + 899,
             "jti": secrets.token_urlsafe(16),
         }
-        signed_jwt = jwt.encode(payload, self._private_key_pem, algorithm="RS256")
+        signed_jwt = self._sign_jwt(payload)
 
         resp = requests.post(
             TOKEN_ENDPOINT,
@@ -73,13 +116,15 @@ class TokenManager:
         resp.raise_for_status()
         data = resp.json()
         self._token = data["access_token"]
+        # Renew 30s early so requests never go out with an expiring token
+        self._expires_at = time.time() + int(data.get("expires_in", 899)) - 30
+        SESSION.headers["Authorization"] = f"Bearer {self._token}"
         print(f"  Token acquired (expires in {data.get('expires_in', '?')}s)")
 
-    @property
-    def token(self):
-        if not self._token:
+    def ensure_token(self):
+        """Acquire a token if none is held or it is about to expire."""
+        if not self._token or time.time() >= self._expires_at:
             self.refresh()
-        return self._token
 
 
 # Global token manager
@@ -87,24 +132,24 @@ token_mgr = None
 
 
 def _do_request(method, path, params=None, rev=None):
-    """Execute an API request, retry once on 401 with a refreshed token."""
+    """Execute an API request, retry once on 401 with a refreshed token as a safety net."""
     url = f"{BASE_URL}{path}"
+    # Static headers and the bearer token already live on SESSION
+    headers = {"If-Match": rev} if rev else None
     for attempt in range(2):
-        headers = {**HEADERS, "Authorization": f"Bearer {token_mgr.token}"}
-        if rev:
-            headers["If-Match"] = rev
-        resp = method(url, headers=headers, params=params)
+        token_mgr.ensure_token()
+        resp = SESSION.request(method, url, headers=headers, params=params)
         if resp.status_code == 401 and attempt == 0:
             print("  Token expired, refreshing...")
             token_mgr.refresh()
             continue
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
 
 def api_get(path, params=None):
     """GET request to PAIC IDM API."""
-    return _do_request(requests.get, path, params=params)
+    return _do_request("GET", path, params=params)
 
 
 def find_latest_recon():
@@ -118,89 +163,87 @@ def find_latest_recon():
         print(f"ERROR: No recon found for mapping '{MAPPING_NAME}'")
         sys.exit(1)
 
-    recons.sort(key=lambda r: r.get("started", ""), reverse=True)
-    latest = recons[0]
-    return latest
+    # Pick the run with the latest started timestamp
+    return max(recons, key=lambda r: r.get("started", ""))
 
 
-def get_found_already_linked_entries(recon_id):
-    """Get all FOUND_ALREADY_LINKED entries from the recon, handling pagination."""
-    entries = []
+def iter_pages(path, params):
+    """Yield result batches from a paged query, handling pagination.
+
+    Starts at PAGE_SIZE and drops to FALLBACK_PAGE_SIZE if the server rejects the first page.
+    """
+    page_size = PAGE_SIZE
     cookie = None
-    page = 0
 
     while True:
-        params = {
-            "_queryFilter": 'situation eq "FOUND_ALREADY_LINKED"',
-            "_pageSize": "500",
-        }
+        page_params = {**params, "_pageSize": str(page_size)}
         if cookie:
-            params["_pagedResultsCookie"] = cookie
+            page_params["_pagedResultsCookie"] = cookie
+
+        try:
+            data = api_get(path, params=page_params)
+        except requests.exceptions.HTTPError as e:
+            if cookie or page_size == FALLBACK_PAGE_SIZE or e.response is None or e.response.status_code != 400:
+                raise
+            print(f"  Page size {page_size} rejected, retrying with {FALLBACK_PAGE_SIZE}")
+            page_size = FALLBACK_PAGE_SIZE
+            continue
 
-        data = api_get(f"/recon/assoc/{recon_id}/entry", params=params)
         batch = data.get("result", [])
-        entries.extend(batch)
-        page += 1
-        print(f"  Fetched page {page}: {len(batch)} entries")
+        yield batch
 
         cookie = data.get("pagedResultsCookie")
         if not cookie or len(batch) == 0:
             break
 
+
+def get_found_already_linked_entries(recon_id):
+    """Get all FOUND_ALREADY_LINKED entries from the recon, handling pagination."""
+    entries = []
+    params = {
+        "_queryFilter": 'situation eq "FOUND_ALREADY_LINKED"',
+        "_fields": ENTRY_FIELDS,
+    }
+
+    for page, batch in enumerate(iter_pages(f"/recon/assoc/{recon_id}/entry", params), 1):
+        entries.extend(batch)
+        print(f"  Fetched page {page}: {len(batch)} entries")
+
     return entries
 
 
 def find_link(source_id, target_id):
     """Find the link object for the given source/target pair matching our mapping."""
-    search_ids = set(filter(None, [source_id, target_id]))
-    candidates = []
-
-    for search_id in search_ids:
-        for field in ["firstId", "secondId"]:
-            data = api_get(
-                "/repo/link",
-                params={"_queryFilter": f'{field} eq "{search_id}"'}
-            )
-            candidates.extend(data.get("result", []))
-
-    # Deduplicate by _id
-    seen = set()
-    unique = []
-    for c in candidates:
-        if c["_id"] not in seen:
-            seen.add(c["_id"])
-            unique.append(c)
-
-    # Filter to links matching our mapping's linkType
-    matching = [c for c in unique if c.get("linkType") == MAPPING_NAME]
-    return matching
+    # Search by both IDs in both positions: the stale link pairs one of them with
+    # some other object, so an exact firstId/secondId match would miss it
+    search_ids = sorted(set(filter(None, [source_id, target_id])))
+    if not search_ids:
+        return []
+
+    clauses = [f'{field} eq "{search_id}"' for search_id in search_ids for field in ("firstId", "secondId")]
+    data = api_get(
+        "/repo/link",
+        params={
+            "_queryFilter": "(" + " or ".join(clauses) + f') and linkType eq "{MAPPING_NAME}"',
+            "_fields": LINK_FIELDS,
+        }
+    )
+    return data.get("result", [])
 
 
 def get_all_links_for_mapping():
     """Get all link _ids for the mapping directly via /repo/link, handling pagination."""
     link_ids = []
-    cookie = None
-    page = 0
+    params = {
+        "_queryFilter": f'linkType eq "{MAPPING_NAME}"',
+        "_fields": "_id",
+    }
 
-    while True:
-        params = {
-            "_queryFilter": f'linkType eq "{MAPPING_NAME}"',
-            "_pageSize": "500",
-        }
-        if cookie:
-            params["_pagedResultsCookie"] = cookie
-
-        data = api_get("/repo/link", params=params)
-        batch = data.get("result", [])
+    for page, batch in enumerate(iter_pages("/repo/link", params), 1):
         for link in batch:
             link_ids.append(link["_id"])
-        page += 1
         print(f"  Fetched page {page}: {len(batch)} links")
 
-        cookie = data.get("pagedResultsCookie")
-        if not cookie or len(batch) == 0:
-            break
-
     return link_ids
 
 
@@ -7,14 +7,26 @@ entries, locates their link objects, and deletes them so the next recon can
 re-link correctly.
 """
 
+import base64
+import contextlib
 import json
+import logging
+import os
 import secrets
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from logging.handlers import MemoryHandler
 
-import jwt
+import orjson
 import requests
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 from jwcrypto import jwk
+from requests.adapters import HTTPAdapter, Retry
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CONSTANTS — update these before running
@@ -25,6 +37,11 @@ SERVICE_ACCOUNT_JWK_FILE = ""  # Path to service account JWK JSON file
 MAPPING_NAME = ""  # IDM mapping name to resolve
 SCOPE = "fr:idm:*"
 SAMPLE_SIZE = -1  # -1 = process all, 0 = dry run (find only), N > 0 = process first N entries
+LOOKUP_WORKERS = 16  # Number of entries whose links are looked up concurrently
+DELETE_WORKERS = 8  # Number of link DELETEs in flight at once
+BATCH_SIZE = 500  # Entries looked up between each round of deletes and checkpoint sync
+CHECKPOINT_FILE = "checkpoint.jsonl"  # Resolved entries are appended here and skipped when the script is re-run
+LOG_LEVEL = logging.INFO  # logging.DEBUG also logs every entry and link as it is processed
 # ──────────────────────────────────────────────────────────────────────────────
 
 BASE_URL = f"https://{TENANT_HOST}/openidm"
@@ -34,20 +51,98 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# Back off exponentially on throttling (429) and transient gateway errors,
+# honoring Retry-After; the final response still goes through raise_for_status()
+RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=("GET", "DELETE"),
+    raise_on_status=False,
+)
+
+# Results requested per page; FALLBACK_PAGE_SIZE is used if the server rejects PAGE_SIZE
+PAGE_SIZE = 1000
+FALLBACK_PAGE_SIZE = 500
+
+# Only request the attributes the scripts read, to keep response payloads small
+ENTRY_FIELDS = "_id,sourceObjectId,targetObjectId"
+LINK_FIELDS = "_id,_rev,firstId,secondId"
+
+# Shared session so every call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=RETRY))
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedStdoutHandler(MemoryHandler):
+    """Buffer log records and write each batch to stdout with a single write and flush."""
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                sys.stdout.write("".join(self.format(record) + "\n" for record in self.buffer))
+                sys.stdout.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+
+def configure_logging():
+    """Log plain messages to stdout, written out in batches."""
+    # Batches are written every 1000 records, on any WARNING, at each flush_log() and at exit
+    handler = BatchedStdoutHandler(capacity=1000, flushLevel=logging.WARNING)
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s", handlers=[handler])
+
+
+def flush_log():
+    """Write out buffered log records so progress shows up during long runs."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def _b64url(data):
+    """Base64url-encode bytes without padding, as used in JWTs."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 class TokenManager:
-    """Token manager that refreshes on 401 errors."""
+    """Token manager that refreshes shortly before expiry, or on 401 errors."""
 
     def __init__(self):
         self._token = None
+        self._expires_at = 0
+        self._lock = threading.Lock()
         # Load JWK once and convert to PEM
         with open(SERVICE_ACCOUNT_JWK_FILE) as f:
             jwk_data = json.load(f)
         key = jwk.JWK(**jwk_data)
-        self._private_key_pem = key.export_to_pem(private_key=True, password=None)
+        pem = key.export_to_pem(private_key=True, password=None)
+        self._private_key = serialization.load_pem_private_key(pem, password=None)
+
+    def _sign_jwt(self, payload):
+        """Return a compact RS256 JWS for the payload, signed with the service account key."""
+        header = {"alg": "RS256", "typ": "JWT"}
+        signing_input = b".".join(
+            _b64url(json.dumps(part, separators=(",", ":")).encode()) for part in (header, payload)
+        )
+        signature = self._private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        return (signing_input + b"." + _b64url(signature)).decode()
+
+    def refresh(self, rejected):
+        """Fetch a new access token via JWT bearer assertion.
+
+        Skipped if another thread already replaced the `rejected` token.
+        """
+        with self._lock:
+            if self._token == rejected:
+                self._fetch_token()
 
-    def refresh(self):
-        """Fetch a new access token via JWT bearer assertion."""
+    def _fetch_token(self):
+        """Sign a JWT bearer assertion and exchange it for an access token."""
         now = int(time.time())
         payload = {
             "iss": SERVICE_ACCOUNT_ID,
@@ -56,7 +151,7 @@ class TokenManager:
             "exp": now + 899,
             "jti": secrets.token_urlsafe(16),
         }
-        signed_jwt = jwt.encode(payload, self._private_key_pem, algorithm="RS256")
+        signed_jwt = self._sign_jwt(payload)
 
         resp = requests.post(
             TOKEN_ENDPOINT,
@@ -70,13 +165,20 @@ class TokenManager:
         )
         resp.raise_for_status()
         data = resp.json()
-        self._token = data["access_token"]
-        print(f"  Token acquired (expires in {data.get('expires_in', '?')}s)")
-
-    @property
-    def token(self):
-        if not self._token:
-            self.refresh()
+        token = data["access_token"]
+        # Renew 30s early so requests never go out with an expiring token
+        self._expires_at = time.time() + int(data.get("expires_in", 899)) - 30
+        SESSION.headers["Authorization"] = f"Bearer {token}"
+        # Publish the token last: ensure_token reads it before _expires_at, so a
+        # thread that sees the new token also sees its new expiry
+        self._token = token
+        logger.info(f"  Token acquired (expires in {data.get('expires_in', '?')}s)")
+
+    def ensure_token(self):
+        """Acquire a token if none is held or it is about to expire, and return it."""
+        token = self._token
+        if not token or time.time() >= self._expires_at:
+            self.refresh(token)
         return self._token
 
 
@@ -85,29 +187,29 @@ token_mgr = None
 
 
 def _do_request(method, path, params=None, rev=None):
-    """Execute an API request, retry once on 401 with a refreshed token."""
+    """Execute an API request, retry once on 401 with a refreshed token as a safety net."""
     url = f"{BASE_URL}{path}"
+    # Static headers and the bearer token already live on SESSION
+    headers = {"If-Match": rev} if rev else None
     for attempt in range(2):
-        headers = {**HEADERS, "Authorization": f"Bearer {token_mgr.token}"}
-        if rev:
-            headers["If-Match"] = rev
-        resp = method(url, headers=headers, params=params)
+        token = token_mgr.ensure_token()
+        resp = SESSION.request(method, url, headers=headers, params=params)
         if resp.status_code == 401 and attempt == 0:
-            print("  Token expired, refreshing...")
-            token_mgr.refresh()
+            logger.warning("  Token expired, refreshing...")
+            token_mgr.refresh(token)
             continue
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
 
 def api_get(path, params=None):
     """GET request to PAIC IDM API."""
-    return _do_request(requests.get, path, params=params)
+    return _do_request("GET", path, params=params)
 
 
 def api_delete(path, rev):
     """DELETE request to PAIC IDM API with If-Match rev."""
-    return _do_request(requests.delete, path, rev=rev)
+    return _do_request("DELETE", path, rev=rev)
 
 
 def find_latest_recon():
@@ -118,165 +220,308 @@ def find_latest_recon():
         if r.get("mapping") == MAPPING_NAME
     ]
     if not recons:
-        print(f"ERROR: No recon found for mapping '{MAPPING_NAME}'")
+        logger.error(f"ERROR: No recon found for mapping '{MAPPING_NAME}'")
         sys.exit(1)
 
-    # Sort by started timestamp descending, pick latest
-    recons.sort(key=lambda r: r.get("started", ""), reverse=True)
-    latest = recons[0]
-    return latest
+    # Pick the run with the latest started timestamp
+    return max(recons, key=lambda r: r.get("started", ""))
+
+
+def fetch_entry_page(recon_id, cookie=None, page_size=PAGE_SIZE):
+    """Fetch one page of FOUND_ALREADY_LINKED entries from the recon."""
+    params = {
+        "_queryFilter": 'situation eq "FOUND_ALREADY_LINKED"',
+        "_fields": ENTRY_FIELDS,
+        "_pageSize": str(page_size),
+    }
+    if cookie:
+        params["_pagedResultsCookie"] = cookie
+    return api_get(f"/recon/assoc/{recon_id}/entry", params=params)
 
 
-def get_found_already_linked_entries(recon_id):
-    """Get all FOUND_ALREADY_LINKED entries from the recon, handling pagination."""
-    entries = []
-    cookie = None
+def iter_found_already_linked_entries(recon_id):
+    """Yield FOUND_ALREADY_LINKED entries from the recon, prefetching the next page in the background."""
     page = 0
+    page_size = PAGE_SIZE
+
+    try:
+        data = fetch_entry_page(recon_id, page_size=page_size)
+    except requests.exceptions.HTTPError as e:
+        if e.response is None or e.response.status_code != 400:
+            raise
+        logger.warning(f"  Page size {page_size} rejected, retrying with {FALLBACK_PAGE_SIZE}")
+        page_size = FALLBACK_PAGE_SIZE
+        data = fetch_entry_page(recon_id, page_size=page_size)
+
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        while data is not None:
+            batch = data.get("result", [])
+            page += 1
+            logger.info(f"  Fetched page {page}: {len(batch)} entries")
+            flush_log()
+
+            # Request page N+1 before handing out page N so the fetch overlaps processing
+            cookie = data.get("pagedResultsCookie")
+            if cookie and batch:
+                next_page = prefetcher.submit(fetch_entry_page, recon_id, cookie, page_size)
+            else:
+                next_page = None
+
+            yield from batch
+            data = next_page.result() if next_page is not None else None
 
-    while True:
-        params = {
-            "_queryFilter": 'situation eq "FOUND_ALREADY_LINKED"',
-            "_pageSize": "500",
+
+def find_link(source_id, target_id):
+    """Find the link object for the given source/target pair matching our mapping."""
+    # Search by both IDs in both positions: the stale link pairs one of them with
+    # some other object, so an exact firstId/secondId match would miss it
+    search_ids = sorted(set(filter(None, [source_id, target_id])))
+    if not search_ids:
+        return []
+
+    clauses = [f'{field} eq "{search_id}"' for search_id in search_ids for field in ("firstId", "secondId")]
+    data = api_get(
+        "/repo/link",
+        params={
+            "_queryFilter": "(" + " or ".join(clauses) + f') and linkType eq "{MAPPING_NAME}"',
+            "_fields": LINK_FIELDS,
         }
-        if cookie:
-            params["_pagedResultsCookie"] = cookie
+    )
+    return data.get("result", [])
 
-        data = api_get(f"/recon/assoc/{recon_id}/entry", params=params)
-        batch = data.get("result", [])
-        entries.extend(batch)
-        page += 1
-        print(f"  Fetched page {page}: {len(batch)} entries")
 
-        cookie = data.get("pagedResultsCookie")
-        if not cookie or len(batch) == 0:
-            break
+def entry_key(entry):
+    """Return the (sourceObjectId, targetObjectId) pair identifying a recon entry."""
+    return entry.get("sourceObjectId"), entry.get("targetObjectId")
 
-    return entries
 
+def unique_entries(entries, seen):
+    """Yield entries whose key is not in `seen`, adding each yielded key to it."""
+    for entry in entries:
+        key = entry_key(entry)
+        if key not in seen:
+            seen.add(key)
+            yield entry
 
-def find_link(source_id, target_id):
-    """Find the link object for the given source/target pair matching our mapping."""
-    # Search by both IDs in both positions
-    search_ids = set(filter(None, [source_id, target_id]))
-    candidates = []
-
-    for search_id in search_ids:
-        for field in ["firstId", "secondId"]:
-            data = api_get(
-                "/repo/link",
-                params={"_queryFilter": f'{field} eq "{search_id}"'}
-            )
-            candidates.extend(data.get("result", []))
-
-    # Deduplicate by _id
-    seen = set()
-    unique = []
-    for c in candidates:
-        if c["_id"] not in seen:
-            seen.add(c["_id"])
-            unique.append(c)
-
-    # Filter to links matching our mapping's linkType
-    matching = [c for c in unique if c.get("linkType") == MAPPING_NAME]
-    return matching
+
+def load_checkpoint(recon_id):
+    """Return the entry keys already resolved for this recon by earlier runs."""
+    resolved = set()
+    try:
+        with open(CHECKPOINT_FILE) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn last line from an interrupted run
+                if record.get("reconId") == recon_id:
+                    resolved.add((record.get("sourceObjectId"), record.get("targetObjectId")))
+    except FileNotFoundError:
+        pass
+    return resolved
+
+
+def record_checkpoint(checkpoint, recon_id, key):
+    """Append a resolved entry key to the open checkpoint file."""
+    source_id, target_id = key
+    record = {"reconId": recon_id, "sourceObjectId": source_id, "targetObjectId": target_id, "ts": int(time.time())}
+    checkpoint.write(json.dumps(record) + "\n")
+
+
+def sync_checkpoint(checkpoint):
+    """Push checkpoint records to disk so they survive the process being killed."""
+    checkpoint.flush()
+    os.fsync(checkpoint.fileno())
+
+
+def lookup_entry(entry):
+    """Resolve a recon entry to its source/target ids and matching link objects."""
+    source_id = entry.get("sourceObjectId")
+    target_id = entry.get("targetObjectId")
+    return source_id, target_id, find_link(source_id, target_id)
+
+
+def delete_link(link):
+    """Delete a link given as (_id, _rev); return the _id, whether it was already gone, and any error."""
+    link_id, link_rev = link
+    try:
+        api_delete(f"/repo/link/{link_id}", link_rev)
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return link_id, True, None  # Already deleted via another entry in an earlier batch
+        return link_id, False, e
+    except Exception as e:
+        return link_id, False, e
+    return link_id, False, None
+
+
+def delete_batch(executor, batch, checkpoint, recon_id, verbose):
+    """Delete the links found for a batch of (entry key, links); return (deleted, failed).
+
+    Entries whose links were all deleted are checkpointed.
+    """
+    # Keyed by link _id so a link shared by several entries is deleted once
+    to_delete = {link["_id"]: link["_rev"] for _, links in batch for link in links}
+    flush_log()
+    logger.info(f"Deleting {len(to_delete)} links...")
+
+    deleted = 0
+    failed_ids = set()
+    for link_id, already_gone, error in executor.map(delete_link, to_delete.items()):
+        if error:
+            logger.error(f"  ERROR deleting link {link_id}: {error}")
+            failed_ids.add(link_id)
+        elif already_gone:
+            if verbose:
+                logger.debug(f"  Link {link_id} already deleted")
+        else:
+            if verbose:
+                logger.debug(f"  DELETED link {link_id}")
+            deleted += 1
+
+    for key, links in batch:
+        if not any(link["_id"] in failed_ids for link in links):
+            record_checkpoint(checkpoint, recon_id, key)
+    return deleted, len(failed_ids)
+
+
+def bounded_map(executor, fn, items, window):
+    """Like executor.map, but pull from `items` lazily with at most `window` calls in flight."""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def main():
+    configure_logging()
     mode = "DRY RUN" if SAMPLE_SIZE == 0 else f"SAMPLE ({SAMPLE_SIZE})" if SAMPLE_SIZE > 0 else "ALL"
-    print(f"Tenant:  {TENANT_HOST}")
-    print(f"Mapping: {MAPPING_NAME}")
-    print(f"Mode:    {mode}")
-    print()
+    logger.info(f"Tenant:  {TENANT_HOST}")
+    logger.info(f"Mapping: {MAPPING_NAME}")
+    logger.info(f"Mode:    {mode}")
+    logger.info("")
 
     # Step 1: Initialize token manager
     global token_mgr
-    print("Initializing token manager...")
+    logger.info("Initializing token manager...")
     token_mgr = TokenManager()
-    print()
+    logger.info("")
 
     # Step 2: Find latest recon
-    print("Finding latest recon...")
+    logger.info("Finding latest recon...")
     recon = find_latest_recon()
     recon_id = recon["_id"]
     fal_count = recon.get("situationSummary", {}).get("FOUND_ALREADY_LINKED", 0)
-    print(f"  Recon ID: {recon_id}")
-    print(f"  State:    {recon['state']}")
-    print(f"  Started:  {recon.get('started')}")
-    print(f"  FOUND_ALREADY_LINKED: {fal_count}")
-    print()
+    logger.info(f"  Recon ID: {recon_id}")
+    logger.info(f"  State:    {recon['state']}")
+    logger.info(f"  Started:  {recon.get('started')}")
+    logger.info(f"  FOUND_ALREADY_LINKED: {fal_count}")
+    logger.info("")
 
     if fal_count == 0:
-        print("No FOUND_ALREADY_LINKED items found. Nothing to do.")
+        logger.info("No FOUND_ALREADY_LINKED items found. Nothing to do.")
         return
 
-    # Step 3: Get FOUND_ALREADY_LINKED entries
-    print("Fetching FOUND_ALREADY_LINKED entries...")
-    entries = get_found_already_linked_entries(recon_id)
-    print(f"  Total entries: {len(entries)}")
-    print()
-
-    if not entries:
-        print("No entries found (association data may not exist). Was recon run with persistAssociations=true?")
-        return
+    # Step 3: Stream FOUND_ALREADY_LINKED entries page by page, skipping duplicates and
+    # any resolved by earlier runs; duplicate entries would only find the same links again
+    dry_run = SAMPLE_SIZE == 0
+    resolved = set() if dry_run else load_checkpoint(recon_id)
+    if resolved:
+        logger.info(f"Resuming: {len(resolved)} entries already resolved per {CHECKPOINT_FILE}")
+    logger.info("Fetching FOUND_ALREADY_LINKED entries...")
+    entries = unique_entries(iter_found_already_linked_entries(recon_id), seen=set(resolved))
+    remaining = max(fal_count - len(resolved), 0)
 
     # Step 4: Find and delete links
+    processed = 0
     deleted = 0
     failed = 0
     not_found = 0
-    dry_run = SAMPLE_SIZE == 0
+    batch = []  # (entry key, links) found since the last round of deletes
 
     if SAMPLE_SIZE > 0:
-        to_process = entries[:SAMPLE_SIZE]
-        print(f"SAMPLE MODE: processing first {len(to_process)} of {len(entries)} entries")
+        to_process = islice(entries, SAMPLE_SIZE)
+        total = min(SAMPLE_SIZE, remaining)
+        logger.info(f"SAMPLE MODE: processing first {total} of {remaining} entries")
     elif SAMPLE_SIZE == 0:
         to_process = entries
-        print(f"DRY RUN MODE: listing all {len(entries)} entries without deleting")
+        total = remaining
+        logger.info(f"DRY RUN MODE: listing all {remaining} entries without deleting")
     else:
         to_process = entries
-
-    print()
-
-    for i, entry in enumerate(to_process, 1):
-        source_id = entry.get("sourceObjectId")
-        target_id = entry.get("targetObjectId")
-        print(f"[{i}/{len(to_process)}] source={source_id} target={target_id}")
-
-        links = find_link(source_id, target_id)
-        if not links:
-            print(f"  WARNING: No matching link found for linkType={MAPPING_NAME}")
-            not_found += 1
-            continue
-
-        for link in links:
-            link_id = link["_id"]
-            link_rev = link["_rev"]
-            print(f"  Found link: {link_id} (firstId={link['firstId']}, secondId={link['secondId']})")
-
-            if dry_run:
-                print(f"  [DRY RUN] Would delete link {link_id}")
-            else:
-                try:
-                    api_delete(f"/repo/link/{link_id}", link_rev)
-                    print(f"  DELETED link {link_id}")
-                    deleted += 1
-                except Exception as e:
-                    print(f"  ERROR deleting link {link_id}: {e}")
-                    failed += 1
+        total = remaining
+
+    logger.info("")
+
+    verbose = logger.isEnabledFor(logging.DEBUG)
+    checkpoint_file = contextlib.nullcontext() if dry_run else open(CHECKPOINT_FILE, "a")
+
+    # Look up links concurrently while pages stream in (results come back in entry order),
+    # and every BATCH_SIZE entries delete what was found and sync the checkpoint
+    with checkpoint_file as checkpoint, ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as lookups:
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as deletes:
+            results = bounded_map(lookups, lookup_entry, to_process, LOOKUP_WORKERS * 4)
+            for i, (source_id, target_id, links) in enumerate(results, 1):
+                processed = i
+                if verbose:
+                    logger.debug(f"[{i}/{total}] source={source_id} target={target_id}")
+
+                if not links:
+                    logger.warning(
+                        f"  WARNING: No matching link found for linkType={MAPPING_NAME} "
+                        f"(source={source_id} target={target_id})"
+                    )
+                    not_found += 1
+                    if checkpoint is not None:
+                        record_checkpoint(checkpoint, recon_id, (source_id, target_id))
+                else:
+                    for link in links:
+                        link_id = link["_id"]
+                        if verbose:
+                            logger.debug(f"  Found link: {link_id} (firstId={link['firstId']}, secondId={link['secondId']})")
+                        if dry_run:
+                            logger.info(f"  [DRY RUN] Would delete link {link_id} (source={source_id} target={target_id})")
+                    if not dry_run:
+                        batch.append(((source_id, target_id), links))
+
+                if checkpoint is not None and i % BATCH_SIZE == 0:
+                    if batch:
+                        batch_deleted, batch_failed = delete_batch(deletes, batch, checkpoint, recon_id, verbose)
+                        deleted += batch_deleted
+                        failed += batch_failed
+                        batch = []
+                    sync_checkpoint(checkpoint)
+
+            if processed == 0 and not resolved:
+                logger.info("No entries found (association data may not exist). Was recon run with persistAssociations=true?")
+                return
+
+            if batch:
+                batch_deleted, batch_failed = delete_batch(deletes, batch, checkpoint, recon_id, verbose)
+                deleted += batch_deleted
+                failed += batch_failed
+            if checkpoint is not None:
+                sync_checkpoint(checkpoint)
 
     # Summary
-    print()
-    print("=" * 60)
-    print("Summary")
-    print("=" * 60)
-    print(f"  Total FOUND_ALREADY_LINKED entries: {len(entries)}")
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info("Summary")
+    logger.info("=" * 60)
+    logger.info(f"  Total FOUND_ALREADY_LINKED entries: {fal_count}")
+    if resolved:
+        logger.info(f"  Resolved earlier: {len(resolved)}")
     if SAMPLE_SIZE > 0:
-        print(f"  Sampled:         {len(to_process)}")
-    print(f"  Links deleted:   {deleted}")
-    print(f"  Links not found: {not_found}")
-    print(f"  Failures:        {failed}")
+        logger.info(f"  Sampled:         {processed}")
+    logger.info(f"  Links deleted:   {deleted}")
+    logger.info(f"  Links not found: {not_found}")
+    logger.info(f"  Failures:        {failed}")
     if dry_run:
-        print()
-        print("  This was a DRY RUN. Set SAMPLE_SIZE = -1 to delete all.")
+        logger.info("")
+        logger.info("  This was a DRY RUN. Set SAMPLE_SIZE = -1 to delete all.")
 
 
 if __name__ == "__main__":